@@ -1,9 +1,17 @@
-import pandas as pd
+import numpy as np
+import openpyxl
 from pptx import Presentation
-from pptx.util import Inches, Pt
-from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
+from pptx.opc.constants import CONTENT_TYPE as CT, RELATIONSHIP_TYPE as RT
+from pptx.opc.oxml import CT_Relationships, serialize_part_xml
+from pptx.opc.packuri import PackURI
+from pptx.oxml import parse_xml
+from pptx.util import Inches
 from pptx.dml.color import RGBColor
-import random
+import io
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from xml.sax.saxutils import escape
 
 # ================================
 # CONFIGURATION PARAMETERS
@@ -13,6 +21,8 @@ import random
 INPUT_FILE = "../data/words.xlsx"  # Excel file with words (relative to src folder)
 SHEET_NAME = "Sheet1"
 OUTPUT_FILE = "../output/words_presentation_3sec.pptx"  # Output location
+COMPRESSION_LEVEL = 1  # Zip compression for the output (1 = fastest, 9 = smallest)
+WRITE_BUFFER_SIZE = 1 << 20  # Bytes buffered before each write to the output file
 
 # Font settings
 FONT_NAME = "DCH-Basisschrift"  # Font to use (install from ../fonts/ folder)
@@ -42,13 +52,32 @@ RANDOMIZE_ORDER = True  # Whether to shuffle words randomly
 CHAR_WIDTH_FACTOR = 0.6  # Approximation: each char takes this * font_size in width
 
 # Progress reporting
+VERBOSE = True  # Print progress while building (start and end summaries always show)
 SHOW_PROGRESS_EVERY = 20  # Show progress every N slides
 SHOW_FIRST_N_SLIDES = 10  # Always show progress for first N slides
+PROGRESS_FLUSH_EVERY = 500  # Write collected progress lines to the console in batches
+
+# Parallel slide rendering
+RENDER_WORKERS = 1  # Processes rendering slide XML (1 = render in this process)
+RENDER_CHUNK_SIZE = 50  # Slides sent to a worker process at a time
 
 # ================================
 # END CONFIGURATION
 # ================================
 
+# XML namespaces used in slide markup
+NS_A = "http://schemas.openxmlformats.org/drawingml/2006/main"
+NS_P = "http://schemas.openxmlformats.org/presentationml/2006/main"
+NS_R = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+
+
+def log(*args, **kwargs):
+    """
+    Print progress output, unless VERBOSE is disabled
+    """
+    if VERBOSE:
+        print(*args, **kwargs)
+
 
 def find_optimal_font_size(
     word,
@@ -60,106 +89,254 @@ def find_optimal_font_size(
     Calculate optimal font size based on word length and available space
     Approximates text width using character count and font size
     """
+    sizes = find_optimal_font_sizes(
+        np.array([len(word)]), max_width_inches, max_font_size, min_font_size
+    )
+    return int(sizes[0])
+
+
+def find_optimal_font_sizes(
+    lengths,
+    max_width_inches=MAX_TEXT_WIDTH,
+    max_font_size=MAX_FONT_SIZE,
+    min_font_size=MIN_FONT_SIZE,
+):
+    """
+    Calculate optimal font sizes for an array of word lengths in one vectorized pass
+    Picks the largest size on the FONT_STEP_SIZE grid (counting down from
+    max_font_size) whose estimated width fits, solved directly for each length
+    """
     # Convert inches to points (1 inch = 72 points)
     max_width_points = max_width_inches * 72
 
-    for font_size in range(max_font_size, min_font_size - 1, -FONT_STEP_SIZE):
-        # Estimate text width: char_count * font_size * factor
-        estimated_width = len(word) * font_size * CHAR_WIDTH_FACTOR
+    # Estimated width is char_count * font_size * factor, so solve for font_size
+    # (an empty word fits at any size)
+    with np.errstate(divide="ignore"):
+        fitting_sizes = max_width_points / (lengths * CHAR_WIDTH_FACTOR)
+
+    steps_down = np.ceil((max_font_size - fitting_sizes) / FONT_STEP_SIZE)
+    sizes = max_font_size - np.maximum(steps_down, 0) * FONT_STEP_SIZE
+    return np.maximum(sizes, min_font_size).astype(np.int64)
 
-        if estimated_width <= max_width_points:
-            return font_size
 
-    return min_font_size
+def build_transition_xml(advance_time_seconds=3, click_advance=False):
+    """
+    Build the XML of the slide transition for clean auto-advance timing
+    """
+    # Convert seconds to milliseconds for XML
+    advance_time_ms = advance_time_seconds * 1000
+
+    # spd: transition speed, advanceOnClick: mouse click advancement,
+    # advanceAfterTime/dur: automatic advance timing
+    return (
+        f'<p:transition spd="fast" advanceOnClick="{int(click_advance)}"'
+        f' advanceAfterTime="{advance_time_ms}" dur="{advance_time_ms}"/>'
+    )
 
 
-def set_slide_transitions(presentation, advance_time_seconds=3, click_advance=False):
+def build_textbox_xml_template():
     """
-    Set slide transition properties for all slides using XML manipulation
-    Clears all existing timings first, then sets clean auto-advance timing
+    Build the XML of the word text box as a format string with {word} and {size}
+    Produces the same markup as add_textbox() plus the text frame and font setters,
+    without the per-attribute XML round trips for every slide
     """
-    try:
-        from lxml import etree
+    font_name = escape(FONT_NAME, {'"': "&quot;"})
+    font_color = str(RGBColor(*FONT_COLOR_RGB))
+    bold = "1" if FONT_BOLD else "0"
+
+    return (
+        # The text box is the only shape on its slide and the shape tree itself has
+        # id 1, so its shape id is always 2 and never needs to be looked up
+        '<p:sp><p:nvSpPr><p:cNvPr id="2" name="TextBox 1"/><p:cNvSpPr txBox="1"/>'
+        "<p:nvPr/></p:nvSpPr>"
+        "<p:spPr><a:xfrm>"
+        f'<a:off x="{Inches(SLIDE_MARGIN_LEFT)}" y="{Inches(SLIDE_MARGIN_TOP)}"/>'
+        f'<a:ext cx="{Inches(SLIDE_WIDTH)}" cy="{Inches(SLIDE_HEIGHT)}"/>'
+        '</a:xfrm><a:prstGeom prst="rect"><a:avLst/></a:prstGeom><a:noFill/></p:spPr>'
+        # Centered vertically, single line, manual sizing, no inner margins
+        '<p:txBody><a:bodyPr wrap="none" anchor="ctr" lIns="0" rIns="0" tIns="0" bIns="0"/>'
+        '<a:lstStyle/><a:p><a:pPr algn="ctr">'
+        f'<a:defRPr sz="{{size}}" b="{bold}">'
+        f'<a:solidFill><a:srgbClr val="{font_color}"/></a:solidFill>'
+        f'<a:latin typeface="{font_name}"/>'
+        "</a:defRPr></a:pPr><a:r><a:t>{word}</a:t></a:r></a:p></p:txBody></p:sp>"
+    )
 
-        # Convert seconds to milliseconds for XML
-        advance_time_ms = advance_time_seconds * 1000
 
-        transitions_set = 0
+def build_slide_xml_template(advance_time_seconds=3, click_advance=False):
+    """
+    Build the complete XML of a word slide as a format string with {word} and {size}
+    Matches what python-pptx writes for a blank slide holding the word text box,
+    with the auto-advance transition already in place
+    """
+    return (
+        "<?xml version='1.0' encoding='UTF-8' standalone='yes'?>\n"
+        f'<p:sld xmlns:a="{NS_A}" xmlns:p="{NS_P}" xmlns:r="{NS_R}">'
+        "<p:cSld><p:spTree>"
+        '<p:nvGrpSpPr><p:cNvPr id="1" name=""/><p:cNvGrpSpPr/><p:nvPr/></p:nvGrpSpPr>'
+        "<p:grpSpPr/>" + build_textbox_xml_template() + "</p:spTree></p:cSld>"
+        "<p:clrMapOvr><a:masterClrMapping/></p:clrMapOvr>"
+        + build_transition_xml(advance_time_seconds, click_advance)
+        + "</p:sld>"
+    )
 
-        for slide in presentation.slides:
-            slide_element = slide.element
 
-            # Remove any existing transition elements first (reset to null)
-            existing_transitions = slide_element.findall(
-                ".//{http://schemas.openxmlformats.org/presentationml/2006/main}transition"
-            )
-            for transition in existing_transitions:
-                slide_element.remove(transition)
+def render_slide_xml(slide_template, word, font_size):
+    """
+    Fill in `slide_template` for one word at the given font size
+    """
+    return slide_template.format(word=escape(word), size=font_size * 100)
 
-            # Create fresh transition element
-            transition_elem = etree.SubElement(
-                slide_element,
-                "{http://schemas.openxmlformats.org/presentationml/2006/main}transition",
-            )
 
-            # Set transition properties (clean slate)
-            transition_elem.set("spd", "fast")  # Transition speed
+def build_word_slides(words, sizes, slide_template, workers=1):
+    """
+    Lazily build the XML of one slide per word, with the word centered at its
+    font size, by filling in `slide_template`
+    With more than one worker the slides are rendered in a process pool, in
+    chunks of RENDER_CHUNK_SIZE; they are still yielded in word order
+    """
+    render = partial(render_slide_xml, slide_template)
+    words, sizes = words.tolist(), sizes.tolist()
+
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            slides = executor.map(render, words, sizes, chunksize=RENDER_CHUNK_SIZE)
+            yield from report_progress(words, sizes, slides)
+    else:
+        yield from report_progress(words, sizes, map(render, words, sizes))
+
 
-            # Disable mouse click advancement
-            if click_advance:
-                transition_elem.set("advanceOnClick", "1")
+def report_progress(words, sizes, slides):
+    """
+    Pass `slides` through, reporting progress for the first slides and then
+    every SHOW_PROGRESS_EVERY slides
+    """
+    # Progress lines are collected and written in batches rather than one by one
+    progress_lines = []
+
+    # Settings used for every slide, read once into locals
+    verbose = VERBOSE
+    show_first_n_slides = SHOW_FIRST_N_SLIDES
+    show_progress_every = SHOW_PROGRESS_EVERY
+    max_font_size = MAX_FONT_SIZE
+
+    for i, (word, optimal_size, slide_xml) in enumerate(zip(words, sizes, slides)):
+        # Progress reporting (no emoji, as it is printed while slides are built)
+        if verbose and (i < show_first_n_slides or i % show_progress_every == 0):
+            if optimal_size < max_font_size:
+                progress_lines.append(
+                    f"  Slide {i+1}: '{word}' (font: {optimal_size}pt)"
+                )
             else:
-                transition_elem.set("advanceOnClick", "0")  # Explicitly disable clicks
+                progress_lines.append(f"  Slide {i+1}: '{word}'")
 
-            # Set automatic advance timing (3 seconds)
-            transition_elem.set("advanceAfterTime", str(advance_time_ms))
+            if len(progress_lines) >= PROGRESS_FLUSH_EVERY:
+                log("\n".join(progress_lines))
+                progress_lines.clear()
 
-            # Add additional attributes for better compatibility
-            transition_elem.set("dur", str(advance_time_ms))  # Duration
+        yield slide_xml
 
-            transitions_set += 1
+    if progress_lines:
+        log("\n".join(progress_lines))
 
-        print(f"✅ Reset and configured transitions on {transitions_set} slides")
-        print(
-            f"   • Duration reset to null, then set to {advance_time_seconds}s auto-advance"
-        )
-        print(f"   • Mouse click: {'Enabled' if click_advance else 'Disabled'}")
-        return True
 
-    except ImportError:
-        print("⚠️  lxml not available - cannot set transitions programmatically")
-        return False
-    except Exception as e:
-        print(f"⚠️  Error setting transitions: {str(e)[:50]}...")
-        return False
+def write_presentation(presentation, slide_layout, slides, output_file):
+    """
+    Save `presentation` to `output_file` with `slides` (slide XML) streamed into it
+    Each slide is written into the zip as soon as it is produced and then dropped,
+    so peak memory does not grow with the number of slides. The parts that list the
+    slides (content types, presentation.xml and its rels) are written at the end
+    Returns the number of slides written
+    """
+    # Masters, layouts and theme come from python-pptx's own (slide-less) package
+    scaffold = io.BytesIO()
+    presentation.save(scaffold)
+
+    # Every slide has the same single relationship, to the chosen slide layout
+    slide_rels = CT_Relationships.new()
+    slide_rels.add_rel(
+        "rId1", RT.SLIDE_LAYOUT, slide_layout.part.partname.relative_ref("/ppt/slides")
+    )
+    slide_rels_xml = serialize_part_xml(slide_rels)
+
+    # Near-identical slide XML compresses well even at a fast level, and a large
+    # write buffer avoids many small writes to the OS
+    with zipfile.ZipFile(scaffold) as template, open(
+        output_file, "wb", buffering=WRITE_BUFFER_SIZE
+    ) as output, zipfile.ZipFile(
+        output, "w", zipfile.ZIP_DEFLATED, compresslevel=COMPRESSION_LEVEL
+    ) as pptx_file:
+        slide_count = 0
+        for slide_count, slide_xml in enumerate(slides, start=1):
+            pptx_file.writestr(f"ppt/slides/slide{slide_count}.xml", slide_xml)
+            pptx_file.writestr(
+                f"ppt/slides/_rels/slide{slide_count}.xml.rels", slide_rels_xml
+            )
 
+        # Register the slides with the package and the presentation part
+        content_types = parse_xml(template.read("[Content_Types].xml"))
+        presentation_xml = parse_xml(template.read("ppt/presentation.xml"))
+        presentation_rels = parse_xml(template.read("ppt/_rels/presentation.xml.rels"))
+
+        sldIdLst = presentation_xml.get_or_add_sldIdLst()
+        first_rId = len(presentation_rels) + 1  # a new package uses rId1..rIdN
+        for n in range(1, slide_count + 1):
+            rId = f"rId{first_rId + n - 1}"
+            content_types.add_override(
+                PackURI(f"/ppt/slides/slide{n}.xml"), CT.PML_SLIDE
+            )
+            presentation_rels.add_rel(rId, RT.SLIDE, f"slides/slide{n}.xml")
+            sldIdLst._add_sldId(id=255 + n, rId=rId)  # slide ids start at 256
+
+        updated_parts = {
+            "[Content_Types].xml": content_types,
+            "ppt/presentation.xml": presentation_xml,
+            "ppt/_rels/presentation.xml.rels": presentation_rels,
+        }
+        for name in template.namelist():
+            if name in updated_parts:
+                pptx_file.writestr(name, serialize_part_xml(updated_parts[name]))
+            else:
+                pptx_file.writestr(name, template.read(name))
 
-def create_word_presentation():
-    print("=" * 60)
-    print("POWERPOINT WORD PRESENTATION GENERATOR")
-    print("=" * 60)
-    print(f"📁 Input file: {INPUT_FILE}")
-    print(f"📄 Output file: {OUTPUT_FILE}")
-    print(f"🎨 Font: {FONT_NAME} ({MIN_FONT_SIZE}pt - {MAX_FONT_SIZE}pt)")
-    print(f"🎲 Randomize order: {RANDOMIZE_ORDER}")
-    print(f"⏱️  Auto-advance: {AUTO_ADVANCE_SECONDS} seconds (automatic)")
-    print(f"🖱️  Mouse click: {'Disabled' if DISABLE_MOUSE_CLICK else 'Enabled'}")
-    print("-" * 60)
+    return slide_count
 
-    # Read the Excel file without treating first row as header
-    df = pd.read_excel(INPUT_FILE, sheet_name=SHEET_NAME, header=None)
 
-    # Get all words from the first column (index 0)
-    words = df[0].dropna().tolist()
+def create_word_presentation():
+    print(f"""{"=" * 60}
+POWERPOINT WORD PRESENTATION GENERATOR
+{"=" * 60}
+📁 Input file: {INPUT_FILE}
+📄 Output file: {OUTPUT_FILE}
+🎨 Font: {FONT_NAME} ({MIN_FONT_SIZE}pt - {MAX_FONT_SIZE}pt)
+🎲 Randomize order: {RANDOMIZE_ORDER}
+⏱️  Auto-advance: {AUTO_ADVANCE_SECONDS} seconds (automatic)
+🖱️  Mouse click: {'Disabled' if DISABLE_MOUSE_CLICK else 'Enabled'}
+{"-" * 60}""")
+
+    # Read the Excel file in streaming mode (no header row, no styles needed)
+    workbook = openpyxl.load_workbook(INPUT_FILE, read_only=True, data_only=True)
+    sheet = workbook[SHEET_NAME]
+
+    # Get all words from the first column (column A) as text, skipping empty cells
+    words = np.asarray(
+        [
+            str(row[0])
+            for row in sheet.iter_rows(min_col=1, max_col=1, values_only=True)
+            if row[0] is not None
+        ],
+        dtype=str,
+    )
+    workbook.close()
 
-    # Randomize the order of words if enabled
+    # Randomize the order of words if enabled (shuffled in place by NumPy)
     if RANDOMIZE_ORDER:
-        random.shuffle(words)
-        print(f"🔀 Words randomized. First few: {words[:5]}")
+        np.random.default_rng().shuffle(words)
+        log(f"🔀 Words randomized. First few: {words[:5].tolist()}")
     else:
-        print(f"📝 Words in original order. First few: {words[:5]}")
+        log(f"📝 Words in original order. First few: {words[:5].tolist()}")
 
-    print(f"📊 Creating presentation with {len(words)} words...")
+    log(f"📊 Creating presentation with {len(words)} words...")
 
     # Create a new presentation
     prs = Presentation()
@@ -167,83 +344,41 @@ def create_word_presentation():
     # Define slide layout (using blank layout)
     blank_slide_layout = prs.slide_layouts[6]  # Blank layout
 
-    font_adjustments = 0
-    size_stats = {"max_size": 0, "large": 0, "medium": 0, "small": 0}
-
-    for i, word in enumerate(words):
-        # Add a slide
-        slide = prs.slides.add_slide(blank_slide_layout)
-
-        # Add a text box with configured dimensions
-        left = Inches(SLIDE_MARGIN_LEFT)
-        top = Inches(SLIDE_MARGIN_TOP)
-        width = Inches(SLIDE_WIDTH)
-        height = Inches(SLIDE_HEIGHT)
-
-        textbox = slide.shapes.add_textbox(left, top, width, height)
-        text_frame = textbox.text_frame
-
-        # Configure text frame for perfect centering
-        text_frame.vertical_anchor = MSO_ANCHOR.MIDDLE  # Center vertically
-        text_frame.word_wrap = False  # Force single line
-        text_frame.auto_size = None  # Manual control
-        text_frame.margin_left = 0
-        text_frame.margin_right = 0
-        text_frame.margin_top = 0
-        text_frame.margin_bottom = 0
-
-        # Configure the text
-        text_frame.clear()
-        paragraph = text_frame.paragraphs[0]
-        paragraph.text = str(word)
-        paragraph.alignment = PP_ALIGN.CENTER  # Center horizontally
-
-        # Calculate optimal font size for this word
-        optimal_size = find_optimal_font_size(word)
-
-        # Format the text with configured font settings
-        font = paragraph.font
-        font.name = FONT_NAME
-        font.size = Pt(optimal_size)
-        font.color.rgb = RGBColor(*FONT_COLOR_RGB)
-        font.bold = FONT_BOLD
-
-        # Track statistics
-        if optimal_size == MAX_FONT_SIZE:
-            size_stats["max_size"] += 1
-        elif optimal_size >= MAX_FONT_SIZE * 0.75:  # 75% of max
-            size_stats["large"] += 1
-        elif optimal_size >= MAX_FONT_SIZE * 0.5:  # 50% of max
-            size_stats["medium"] += 1
-        else:
-            size_stats["small"] += 1
-
-        if optimal_size < MAX_FONT_SIZE:
-            font_adjustments += 1
-
-        # Progress reporting
-        if i < SHOW_FIRST_N_SLIDES or i % SHOW_PROGRESS_EVERY == 0:
-            if optimal_size < MAX_FONT_SIZE:
-                print(f"  📄 Slide {i+1}: '{word}' (font: {optimal_size}pt)")
-            else:
-                print(f"  📄 Slide {i+1}: '{word}'")
-
-    # Set slide transitions programmatically
-    print(f"\n⚙️  Configuring slide transitions...")
-    print(f"   • Resetting all existing slide durations to null")
-    print(f"   • Setting auto-advance to {AUTO_ADVANCE_SECONDS} seconds")
-    print(
+    # Per-word rendering plan as parallel arrays: text, length and font size
+    lengths = np.char.str_len(words)
+    sizes = find_optimal_font_sizes(lengths)
+
+    # Track statistics: bucket each size as small (<50% of max), medium (≥50%),
+    # large (≥75%) or maximum, and count all buckets in one pass
+    medium_threshold = int(MAX_FONT_SIZE * 0.5)  # 50% of max
+    large_threshold = int(MAX_FONT_SIZE * 0.75)  # 75% of max
+    thresholds = np.array([MAX_FONT_SIZE * 0.5, MAX_FONT_SIZE * 0.75, MAX_FONT_SIZE])
+    counts = np.bincount(np.digitize(sizes, thresholds), minlength=4)
+    size_stats = dict(zip(["small", "medium", "large", "max_size"], counts.tolist()))
+    font_adjustments = len(sizes) - size_stats["max_size"]
+
+    # Slide transitions are set programmatically on each slide as it is built
+    log(f"⚙️  Configuring slide transitions...")
+    log(f"   • Resetting all existing slide durations to null")
+    log(f"   • Setting auto-advance to {AUTO_ADVANCE_SECONDS} seconds")
+    log(
         f"   • Mouse click advancement: {'Disabled' if DISABLE_MOUSE_CLICK else 'Enabled'}"
     )
 
-    transition_success = set_slide_transitions(
-        prs,
+    slide_template = build_slide_xml_template(
         advance_time_seconds=AUTO_ADVANCE_SECONDS,
         click_advance=not DISABLE_MOUSE_CLICK,
     )
+    slides = build_word_slides(words, sizes, slide_template, workers=RENDER_WORKERS)
 
-    # Save the presentation
-    prs.save(OUTPUT_FILE)
+    # Save the presentation, writing slides out as they are built
+    slide_count = write_presentation(prs, blank_slide_layout, slides, OUTPUT_FILE)
+
+    log(f"✅ Reset and configured transitions on {slide_count} slides")
+    log(
+        f"   • Duration reset to null, then set to {AUTO_ADVANCE_SECONDS}s auto-advance"
+    )
+    log(f"   • Mouse click: {'Disabled' if DISABLE_MOUSE_CLICK else 'Enabled'}")
 
     print("\n" + "=" * 60)
     print("✅ PRESENTATION CREATED SUCCESSFULLY!")
@@ -253,9 +388,9 @@ def create_word_presentation():
     print(f"🔧 Font adjustments: {font_adjustments} slides")
     print(f"\n📈 Size distribution:")
     print(f"  • Maximum ({MAX_FONT_SIZE}pt): {size_stats['max_size']} words")
-    print(f"  • Large (≥{int(MAX_FONT_SIZE*0.75)}pt): {size_stats['large']} words")
-    print(f"  • Medium (≥{int(MAX_FONT_SIZE*0.5)}pt): {size_stats['medium']} words")
-    print(f"  • Small (<{int(MAX_FONT_SIZE*0.5)}pt): {size_stats['small']} words")
+    print(f"  • Large (≥{large_threshold}pt): {size_stats['large']} words")
+    print(f"  • Medium (≥{medium_threshold}pt): {size_stats['medium']} words")
+    print(f"  • Small (<{medium_threshold}pt): {size_stats['small']} words")
 
     print(f"\n✨ Features enabled:")
     print(f"  ✓ Perfect centering (horizontal & vertical)")
@@ -268,21 +403,12 @@ def create_word_presentation():
     print(f"  ✓ {AUTO_ADVANCE_SECONDS}-second auto-advance")
     print(f"  ✓ Mouse click {'disabled' if DISABLE_MOUSE_CLICK else 'enabled'}")
 
-    if transition_success:
-        print(f"\n🎉 READY TO USE:")
-        print("  • Open the presentation and start slideshow")
-        print(f"  • Slides auto-advance every {AUTO_ADVANCE_SECONDS} seconds")
-        if DISABLE_MOUSE_CLICK:
-            print("  • Mouse clicks are disabled")
-        print("  • No manual setup required!")
-    else:
-        print(f"\n⏱️  MANUAL SETUP REQUIRED:")
-        print("  1. Open the presentation in PowerPoint")
-        print("  2. Go to 'Transitions' tab")
-        if DISABLE_MOUSE_CLICK:
-            print("  3. Uncheck 'On Mouse Click'")
-        print(f"  4. Check 'After' and set to 00:0{AUTO_ADVANCE_SECONDS}")
-        print("  5. Click 'Apply To All'")
+    print(f"\n🎉 READY TO USE:")
+    print("  • Open the presentation and start slideshow")
+    print(f"  • Slides auto-advance every {AUTO_ADVANCE_SECONDS} seconds")
+    if DISABLE_MOUSE_CLICK:
+        print("  • Mouse clicks are disabled")
+    print("  • No manual setup required!")
 
     print(f"\n💡 To customize: Edit parameters at top of {__file__}")
     print(f"🎨 Font note: {FONT_NAME} must be installed for proper display")